@@ -26,8 +26,8 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, TYPE_CHECKING, Union, overload
-from .utils import _get_as_snowflake, get
+from typing import Dict, FrozenSet, List, Optional, TYPE_CHECKING, Tuple, Union, overload
+from .utils import _get_as_snowflake
 from .errors import InvalidArgument
 from .partial_emoji import _EmojiTag
 
@@ -62,6 +62,8 @@ class WelcomeChannel:
         The emoji used beside the channel description.
     """
 
+    __slots__ = ('channel', 'description', 'emoji')
+
     def __init__(self, *, channel: Snowflake, description: str, emoji: Union[PartialEmoji, Emoji, str] = None):
         self.channel = channel
         self.description = description
@@ -71,39 +73,47 @@ class WelcomeChannel:
         return f'<WelcomeChannel channel={self.channel!r} description={self.description!r} emoji={self.emoji!r}>'
 
     @classmethod
-    def _from_dict(cls, *, data: WelcomeScreenChannelPayload, guild: Guild) -> WelcomeChannel:
-        channel_id = _get_as_snowflake(data, 'channel_id')
-        channel = guild.get_channel(channel_id)
+    def _from_resolved(
+        cls, data: WelcomeScreenChannelPayload, channel: Optional[Snowflake], emoji_map: Dict[int, Emoji]
+    ) -> WelcomeChannel:
         description = data['description']
         _emoji_id = _get_as_snowflake(data, 'emoji_id')
         _emoji_name = data['emoji_name']
 
         if _emoji_id:
             # custom
-            emoji = get(guild.emojis, id=_emoji_id)
+            emoji = emoji_map.get(_emoji_id)
         else:
             # unicode or None
             emoji = _emoji_name
 
         return cls(channel=channel, description=description, emoji=emoji)  # type: ignore
 
+    @classmethod
+    def _from_dict(cls, *, data: WelcomeScreenChannelPayload, guild: Guild) -> WelcomeChannel:
+        channel = guild.get_channel(_get_as_snowflake(data, 'channel_id'))
+        emoji_map = {emoji.id: emoji for emoji in guild.emojis}
+        return cls._from_resolved(data, channel, emoji_map)
+
     def to_dict(self) -> WelcomeScreenChannelPayload:
-        ret: WelcomeScreenChannelPayload = {
+        emoji = self.emoji
+        if isinstance(emoji, _EmojiTag):
+            # custom
+            return {
+                'channel_id': self.channel.id,
+                'description': self.description,
+                'emoji_id': emoji.id,  # type: ignore
+                'emoji_name': emoji.name,  # type: ignore
+            }
+
+        # unicode or None
+        return {
             'channel_id': self.channel.id,
             'description': self.description,
             'emoji_id': None,
-            'emoji_name': None,
+            'emoji_name': emoji,
         }
 
-        if isinstance(self.emoji, _EmojiTag):
-            ret['emoji_id'] = self.emoji.id  # type: ignore
-            ret['emoji_name'] = self.emoji.name  # type: ignore
-        else:
-            # unicode or None
-            ret['emoji_name'] = self.emoji
-
-        return ret
-
 
 class WelcomeScreen:
     """Represents a :class:`Guild` welcome screen.
@@ -118,15 +128,27 @@ class WelcomeScreen:
         The channels shown on the welcome screen.
     """
 
+    __slots__ = ('_state', '_guild', '_features_cache', 'description', 'welcome_channels')
+
     def __init__(self, *, data: WelcomeScreenPayload, guild: Guild):
         self._state = guild._state
         self._guild = guild
+        self._features_cache: Optional[Tuple[List[str], FrozenSet[str]]] = None
         self._store(data)
 
     def _store(self, data: WelcomeScreenPayload) -> None:
         self.description = data['description']
         welcome_channels = data.get('welcome_channels', [])
-        self.welcome_channels = [WelcomeChannel._from_dict(data=wc, guild=self._guild) for wc in welcome_channels]
+        # Bind everything the comprehension needs to locals so the hot
+        # loop below is nothing but local loads and calls.
+        guild = self._guild
+        emoji_map = {emoji.id: emoji for emoji in guild.emojis}
+        get_channel = guild.get_channel
+        get_snowflake = _get_as_snowflake
+        from_resolved = WelcomeChannel._from_resolved
+        self.welcome_channels = [
+            from_resolved(wc, get_channel(get_snowflake(wc, 'channel_id')), emoji_map) for wc in welcome_channels
+        ]
 
     def __repr__(self) -> str:
         return f'<WelcomeScreen description={self.description!r} welcome_channels={self.welcome_channels!r} enabled={self.enabled}>'
@@ -138,7 +160,14 @@ class WelcomeScreen:
         This is equivalent to checking if ``WELCOME_SCREEN_ENABLED``
         is present in :attr:`Guild.features`.
         """
-        return 'WELCOME_SCREEN_ENABLED' in self._guild.features
+        features = self._guild.features
+        cache = self._features_cache
+        if cache is None or cache[0] is not features:
+            # The guild swaps its feature list out wholesale on update,
+            # so keying the cache on the list's identity keeps it fresh.
+            cache = (features, frozenset(features))
+            self._features_cache = cache
+        return 'WELCOME_SCREEN_ENABLED' in cache[1]
 
     @overload
     async def edit(
@@ -199,17 +228,24 @@ class WelcomeScreen:
         NotFound
             This welcome screen does not exist.
         """
-        try:
+        if not kwargs:
+            return
+
+        if 'welcome_channels' in kwargs:
             welcome_channels = kwargs['welcome_channels']
-        except KeyError:
-            pass
-        else:
-            welcome_channels_serialised = []
-            for wc in welcome_channels:
-                if not isinstance(wc, WelcomeChannel):
-                    raise InvalidArgument('welcome_channels parameter must be a list of WelcomeChannel')
-                welcome_channels_serialised.append(wc.to_dict())
-            kwargs['welcome_channels'] = welcome_channels_serialised
+            if any(not isinstance(wc, WelcomeChannel) for wc in welcome_channels):
+                raise InvalidArgument('welcome_channels parameter must be a list of WelcomeChannel')
+            welcome_channels_serialised = [wc.to_dict() for wc in welcome_channels]
+            current = self.welcome_channels
+            if (
+                len(welcome_channels_serialised) == len(current)
+                and all(wc.channel is not None for wc in current)
+                and welcome_channels_serialised == [wc.to_dict() for wc in current]
+            ):
+                # Identical to what the screen already shows, so don't send it.
+                del kwargs['welcome_channels']
+            else:
+                kwargs['welcome_channels'] = welcome_channels_serialised
 
         if kwargs:
             data = await self._state.http.edit_welcome_screen(self._guild.id, kwargs)